@@ -8,142 +8,86 @@ import os
 import sys
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-
-class BarbershopProjectSetup:
-    def __init__(self, project_name: str, base_path: str = "."):
-        self.project_name = project_name
-        self.base_path = Path(base_path) / project_name
-        self.config = {
-            "payment": "mercadopago",
-            "email": "sendgrid",
-            "hosting": "digitalocean",
-            "database": "postgresql",
-            "cache": "redis",
-            "language": "es"
-        }
-    
-    def create_directory_structure(self):
-        """Create the monorepo directory structure"""
-        print("📁 Creating directory structure...")
-        
-        directories = [
-            # Root level
-            "apps",
-            "packages",
-            "infrastructure",
-            "docs",
-            
-            # Backend app
-            "apps/api/src/domain/entities",
-            "apps/api/src/domain/value-objects",
-            "apps/api/src/domain/repositories",
-            "apps/api/src/domain/services",
-            "apps/api/src/domain/events",
-            "apps/api/src/application/use-cases/appointment",
-            "apps/api/src/application/use-cases/barber",
-            "apps/api/src/application/use-cases/client",
-            "apps/api/src/application/use-cases/service",
-            "apps/api/src/application/use-cases/payment",
-            "apps/api/src/application/dtos",
-            "apps/api/src/infrastructure/database/repositories",
-            "apps/api/src/infrastructure/database/migrations",
-            "apps/api/src/infrastructure/external/mercadopago",
-            "apps/api/src/infrastructure/external/sendgrid",
-            "apps/api/src/infrastructure/cache",
-            "apps/api/src/presentation/controllers",
-            "apps/api/src/presentation/middleware",
-            "apps/api/test/domain",
-            "apps/api/test/application",
-            "apps/api/test/integration",
-            "apps/api/test/e2e",
-            
-            # Admin dashboard
-            "apps/admin/src/components",
-            "apps/admin/src/app",
-            "apps/admin/src/lib",
-            "apps/admin/src/hooks",
-            
-            # Client web app
-            "apps/web/src/components",
-            "apps/web/src/app",
-            "apps/web/src/lib",
-            "apps/web/src/hooks",
-            
-            # Shared packages
-            "packages/domain",
-            "packages/shared/src/types",
-            "packages/shared/src/utils",
-            "packages/ui/src/components",
-            
-            # Infrastructure
-            "infrastructure/docker",
-            "infrastructure/database",
-            "infrastructure/nginx",
-            
-            # Documentation
-            "docs/architecture",
-            "docs/api",
-            "docs/guides",
-        ]
-        
-        for directory in directories:
-            (self.base_path / directory).mkdir(parents=True, exist_ok=True)
-        
-        print("✅ Directory structure created")
-    
-    def create_root_config_files(self):
-        """Create root-level configuration files"""
-        print("⚙️  Creating configuration files...")
-        
-        # package.json
-        package_json = {
-            "name": self.project_name,
-            "version": "0.1.0",
-            "private": True,
-            "workspaces": ["apps/*", "packages/*"],
-            "scripts": {
-                "dev": "turbo run dev",
-                "build": "turbo run build",
-                "test": "turbo run test",
-                "test:coverage": "turbo run test:coverage",
-                "lint": "turbo run lint",
-                "format": "prettier --write \"**/*.{ts,tsx,md}\""
-            },
-            "devDependencies": {
-                "turbo": "^1.10.0",
-                "prettier": "^3.0.0",
-                "@types/node": "^20.0.0",
-                "typescript": "^5.0.0"
-            }
-        }
-        
-        self._write_json(self.base_path / "package.json", package_json)
-        
-        # turbo.json
-        turbo_json = {
-            "$schema": "https://turbo.build/schema.json",
-            "pipeline": {
-                "build": {
-                    "dependsOn": ["^build"],
-                    "outputs": ["dist/**", ".next/**"]
-                },
-                "test": {
-                    "dependsOn": ["build"],
-                    "outputs": ["coverage/**"]
-                },
-                "lint": {},
-                "dev": {
-                    "cache": False
-                }
-            }
-        }
-        
-        self._write_json(self.base_path / "turbo.json", turbo_json)
-        
-        # .gitignore
-        gitignore_content = """
+from typing import Dict, List, Set
+
+try:
+    import orjson
+
+    def _dump_json(data: Dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(data: Dict) -> bytes:
+        # Raw UTF-8 like orjson, so both paths write the same bytes
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Setup is I/O-bound, so oversubscribe the CPUs a little
+MAX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+# Monorepo layout, built and interned once at import
+DIRECTORIES = tuple(sys.intern(directory) for directory in [
+    # Root level
+    "apps",
+    "packages",
+    "infrastructure",
+    "docs",
+
+    # Backend app
+    "apps/api/src/domain/entities",
+    "apps/api/src/domain/value-objects",
+    "apps/api/src/domain/repositories",
+    "apps/api/src/domain/services",
+    "apps/api/src/domain/events",
+    "apps/api/src/application/use-cases/appointment",
+    "apps/api/src/application/use-cases/barber",
+    "apps/api/src/application/use-cases/client",
+    "apps/api/src/application/use-cases/service",
+    "apps/api/src/application/use-cases/payment",
+    "apps/api/src/application/dtos",
+    "apps/api/src/infrastructure/database/repositories",
+    "apps/api/src/infrastructure/database/migrations",
+    "apps/api/src/infrastructure/external/mercadopago",
+    "apps/api/src/infrastructure/external/sendgrid",
+    "apps/api/src/infrastructure/cache",
+    "apps/api/src/presentation/controllers",
+    "apps/api/src/presentation/middleware",
+    "apps/api/test/domain",
+    "apps/api/test/application",
+    "apps/api/test/integration",
+    "apps/api/test/e2e",
+
+    # Admin dashboard
+    "apps/admin/src/components",
+    "apps/admin/src/app",
+    "apps/admin/src/lib",
+    "apps/admin/src/hooks",
+
+    # Client web app
+    "apps/web/src/components",
+    "apps/web/src/app",
+    "apps/web/src/lib",
+    "apps/web/src/hooks",
+
+    # Shared packages
+    "packages/domain",
+    "packages/shared/src/types",
+    "packages/shared/src/utils",
+    "packages/ui/src/components",
+
+    # Infrastructure
+    "infrastructure/docker",
+    "infrastructure/database",
+    "infrastructure/nginx",
+
+    # Documentation
+    "docs/architecture",
+    "docs/api",
+    "docs/guides",
+])
+
+# .gitignore
+GITIGNORE = """
 node_modules/
 dist/
 .next/
@@ -155,17 +99,16 @@ coverage/
 *.log
 .DS_Store
 """
-        self._write_file(self.base_path / ".gitignore", gitignore_content)
-        
-        # README.md
-        readme_content = f"""# {self.project_name.title()}
+
+# README.md, formatted with the project name
+README_TEMPLATE = """# {title}
 
 Professional barbershop management system built with Clean Architecture.
 
 ## Project Structure
 
 ```
-{self.project_name}/
+{project_name}/
 ├── apps/
 │   ├── api/          # NestJS backend API
 │   ├── admin/        # Admin dashboard (Next.js)
@@ -231,100 +174,9 @@ This project follows Clean Architecture principles:
 
 See `docs/architecture/` for detailed documentation.
 """
-        self._write_file(self.base_path / "README.md", readme_content)
-        
-        print("✅ Configuration files created")
-    
-    def create_backend_app(self):
-        """Create NestJS backend application"""
-        print("🔧 Setting up NestJS backend...")
-        
-        api_path = self.base_path / "apps/api"
-        
-        # package.json for backend
-        package_json = {
-            "name": "@barbershop/api",
-            "version": "0.1.0",
-            "private": True,
-            "scripts": {
-                "dev": "nest start --watch",
-                "build": "nest build",
-                "start": "node dist/main",
-                "test": "jest",
-                "test:watch": "jest --watch",
-                "test:coverage": "jest --coverage",
-                "lint": "eslint \"{src,test}/**/*.ts\""
-            },
-            "dependencies": {
-                "@nestjs/common": "^10.0.0",
-                "@nestjs/core": "^10.0.0",
-                "@nestjs/platform-express": "^10.0.0",
-                "@nestjs/config": "^3.0.0",
-                "@nestjs/jwt": "^10.0.0",
-                "@nestjs/passport": "^10.0.0",
-                "@prisma/client": "^5.0.0",
-                "passport": "^0.6.0",
-                "passport-jwt": "^4.0.0",
-                "bcrypt": "^5.1.0",
-                "class-validator": "^0.14.0",
-                "class-transformer": "^0.5.0",
-                "redis": "^4.6.0"
-            },
-            "devDependencies": {
-                "@nestjs/cli": "^10.0.0",
-                "@nestjs/testing": "^10.0.0",
-                "@types/jest": "^29.0.0",
-                "@types/node": "^20.0.0",
-                "jest": "^29.0.0",
-                "ts-jest": "^29.0.0",
-                "prisma": "^5.0.0"
-            }
-        }
-        
-        self._write_json(api_path / "package.json", package_json)
-        
-        # nest-cli.json
-        nest_cli = {
-            "$schema": "https://json.schemastore.org/nest-cli",
-            "collection": "@nestjs/schematics",
-            "sourceRoot": "src"
-        }
-        
-        self._write_json(api_path / "nest-cli.json", nest_cli)
-        
-        # tsconfig.json
-        tsconfig = {
-            "compilerOptions": {
-                "module": "commonjs",
-                "declaration": True,
-                "removeComments": True,
-                "emitDecoratorMetadata": True,
-                "experimentalDecorators": True,
-                "allowSyntheticDefaultImports": True,
-                "target": "ES2021",
-                "sourceMap": True,
-                "outDir": "./dist",
-                "baseUrl": "./",
-                "incremental": True,
-                "skipLibCheck": True,
-                "strictNullChecks": True,
-                "noImplicitAny": True,
-                "strictBindCallApply": True,
-                "forceConsistentCasingInFileNames": True,
-                "noFallthroughCasesInSwitch": True,
-                "paths": {
-                    "@domain/*": ["src/domain/*"],
-                    "@application/*": ["src/application/*"],
-                    "@infrastructure/*": ["src/infrastructure/*"],
-                    "@presentation/*": ["src/presentation/*"]
-                }
-            }
-        }
-        
-        self._write_json(api_path / "tsconfig.json", tsconfig)
-        
-        # .env.example
-        env_example = """# Application
+
+# apps/api/.env.example
+ENV_EXAMPLE = """# Application
 NODE_ENV=development
 PORT=3001
 API_URL=http://localhost:3001
@@ -351,11 +203,9 @@ SENDGRID_FROM_EMAIL=no-reply@barbershop.com
 WEB_APP_URL=http://localhost:3000
 ADMIN_APP_URL=http://localhost:3002
 """
-        
-        self._write_file(api_path / ".env.example", env_example)
-        
-        # Prisma schema
-        prisma_schema = """
+
+# apps/api/prisma/schema.prisma
+PRISMA_SCHEMA = """
 datasource db {
   provider = "postgresql"
   url      = env("DATABASE_URL")
@@ -482,17 +332,9 @@ model BarberSkill {
   @@map("barber_skills")
 }
 """
-        
-        (api_path / "prisma").mkdir(exist_ok=True)
-        self._write_file(api_path / "prisma/schema.prisma", prisma_schema)
-        
-        print("✅ Backend app created")
-    
-    def create_docker_setup(self):
-        """Create Docker configuration for local development"""
-        print("🐳 Creating Docker setup...")
-        
-        docker_compose = """version: '3.8'
+
+# infrastructure/docker/docker-compose.yml
+DOCKER_COMPOSE = """version: '3.8'
 
 services:
   postgres:
@@ -519,17 +361,9 @@ volumes:
   postgres_data:
   redis_data:
 """
-        
-        infra_path = self.base_path / "infrastructure/docker"
-        self._write_file(infra_path / "docker-compose.yml", docker_compose)
-        
-        print("✅ Docker setup created")
-    
-    def create_github_actions(self):
-        """Create GitHub Actions CI/CD workflow"""
-        print("🔄 Creating GitHub Actions workflow...")
-        
-        workflow = """name: CI/CD Pipeline
+
+# .github/workflows/ci-cd.yml
+CI_CD_WORKFLOW = """name: CI/CD Pipeline
 
 on:
   push:
@@ -604,35 +438,253 @@ jobs:
           echo "Deployment to DigitalOcean will be configured here"
           # Add DigitalOcean deployment steps
 """
+
+class BarbershopProjectSetup:
+    def __init__(self, project_name: str, base_path: str = "."):
+        self.project_name = project_name
+        self.base_path = Path(base_path) / project_name
+        self.config = {
+            "payment": "mercadopago",
+            "email": "sendgrid",
+            "hosting": "digitalocean",
+            "database": "postgresql",
+            "cache": "redis",
+            "language": "es"
+        }
+        # Directories created during the current run(), so repeated mkdirs
+        # skip the syscall
+        self._mkdir_cache: Set[str] = set()
+    
+    def create_directory_structure(self):
+        """Create the monorepo directory structure"""
+        print("📁 Creating directory structure...")
         
-        github_path = self.base_path / ".github/workflows"
-        github_path.mkdir(parents=True, exist_ok=True)
-        self._write_file(github_path / "ci-cd.yml", workflow)
+        # Only create leaf directories; makedirs creates the rest
+        leaves = set(DIRECTORIES)
+        for directory in DIRECTORIES:
+            for parent in Path(directory).parents:
+                leaves.discard(parent.as_posix())
+        
+        base = os.fspath(self.base_path)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = [
+                pool.submit(self._mkdir, os.path.join(base, directory))
+                for directory in sorted(leaves, key=lambda d: d.count("/"), reverse=True)
+            ]
+            for future in futures:
+                future.result()
+        
+        print("✅ Directory structure created")
+    
+    def create_root_config_files(self):
+        """Create root-level configuration files"""
+        # package.json
+        package_json = {
+            "name": self.project_name,
+            "version": "0.1.0",
+            "private": True,
+            "workspaces": ["apps/*", "packages/*"],
+            "scripts": {
+                "dev": "turbo run dev",
+                "build": "turbo run build",
+                "test": "turbo run test",
+                "test:coverage": "turbo run test:coverage",
+                "lint": "turbo run lint",
+                "format": "prettier --write \"**/*.{ts,tsx,md}\""
+            },
+            "devDependencies": {
+                "turbo": "^1.10.0",
+                "prettier": "^3.0.0",
+                "@types/node": "^20.0.0",
+                "typescript": "^5.0.0"
+            }
+        }
+        
+        self._write_json(self.base_path / "package.json", package_json)
+        
+        # turbo.json
+        turbo_json = {
+            "$schema": "https://turbo.build/schema.json",
+            "pipeline": {
+                "build": {
+                    "dependsOn": ["^build"],
+                    "outputs": ["dist/**", ".next/**"]
+                },
+                "test": {
+                    "dependsOn": ["build"],
+                    "outputs": ["coverage/**"]
+                },
+                "lint": {},
+                "dev": {
+                    "cache": False
+                }
+            }
+        }
+        
+        self._write_json(self.base_path / "turbo.json", turbo_json)
+        
+        # .gitignore
+        self._write_file(self.base_path / ".gitignore", GITIGNORE)
+        
+        # README.md
+        readme_content = README_TEMPLATE.format(
+            title=self.project_name.title(),
+            project_name=self.project_name,
+        )
+        self._write_file(self.base_path / "README.md", readme_content)
+    
+    def create_backend_app(self):
+        """Create NestJS backend application"""
+        api_path = self.base_path / "apps/api"
+        
+        # package.json for backend
+        package_json = {
+            "name": "@barbershop/api",
+            "version": "0.1.0",
+            "private": True,
+            "scripts": {
+                "dev": "nest start --watch",
+                "build": "nest build",
+                "start": "node dist/main",
+                "test": "jest",
+                "test:watch": "jest --watch",
+                "test:coverage": "jest --coverage",
+                "lint": "eslint \"{src,test}/**/*.ts\""
+            },
+            "dependencies": {
+                "@nestjs/common": "^10.0.0",
+                "@nestjs/core": "^10.0.0",
+                "@nestjs/platform-express": "^10.0.0",
+                "@nestjs/config": "^3.0.0",
+                "@nestjs/jwt": "^10.0.0",
+                "@nestjs/passport": "^10.0.0",
+                "@prisma/client": "^5.0.0",
+                "passport": "^0.6.0",
+                "passport-jwt": "^4.0.0",
+                "bcrypt": "^5.1.0",
+                "class-validator": "^0.14.0",
+                "class-transformer": "^0.5.0",
+                "redis": "^4.6.0"
+            },
+            "devDependencies": {
+                "@nestjs/cli": "^10.0.0",
+                "@nestjs/testing": "^10.0.0",
+                "@types/jest": "^29.0.0",
+                "@types/node": "^20.0.0",
+                "jest": "^29.0.0",
+                "ts-jest": "^29.0.0",
+                "prisma": "^5.0.0"
+            }
+        }
+        
+        self._write_json(api_path / "package.json", package_json)
+        
+        # nest-cli.json
+        nest_cli = {
+            "$schema": "https://json.schemastore.org/nest-cli",
+            "collection": "@nestjs/schematics",
+            "sourceRoot": "src"
+        }
+        
+        self._write_json(api_path / "nest-cli.json", nest_cli)
         
-        print("✅ GitHub Actions workflow created")
+        # tsconfig.json
+        tsconfig = {
+            "compilerOptions": {
+                "module": "commonjs",
+                "declaration": True,
+                "removeComments": True,
+                "emitDecoratorMetadata": True,
+                "experimentalDecorators": True,
+                "allowSyntheticDefaultImports": True,
+                "target": "ES2021",
+                "sourceMap": True,
+                "outDir": "./dist",
+                "baseUrl": "./",
+                "incremental": True,
+                "skipLibCheck": True,
+                "strictNullChecks": True,
+                "noImplicitAny": True,
+                "strictBindCallApply": True,
+                "forceConsistentCasingInFileNames": True,
+                "noFallthroughCasesInSwitch": True,
+                "paths": {
+                    "@domain/*": ["src/domain/*"],
+                    "@application/*": ["src/application/*"],
+                    "@infrastructure/*": ["src/infrastructure/*"],
+                    "@presentation/*": ["src/presentation/*"]
+                }
+            }
+        }
+        
+        self._write_json(api_path / "tsconfig.json", tsconfig)
+        
+        # .env.example
+        self._write_file(api_path / ".env.example", ENV_EXAMPLE)
+        
+        # Prisma schema
+        self._mkdir(api_path / "prisma")
+        self._write_file(api_path / "prisma/schema.prisma", PRISMA_SCHEMA)
+    
+    def create_docker_setup(self):
+        """Create Docker configuration for local development"""
+        infra_path = self.base_path / "infrastructure/docker"
+        self._write_file(infra_path / "docker-compose.yml", DOCKER_COMPOSE)
+    
+    def create_github_actions(self):
+        """Create GitHub Actions CI/CD workflow"""
+        github_path = self.base_path / ".github/workflows"
+        self._mkdir(github_path)
+        self._write_file(github_path / "ci-cd.yml", CI_CD_WORKFLOW)
+    
+    def _mkdir(self, path):
+        """Create a directory and its parents, once per setup"""
+        path = os.fspath(path)
+        if path in self._mkdir_cache:
+            return
+        os.makedirs(path, exist_ok=True)
+        while path and path not in self._mkdir_cache:
+            self._mkdir_cache.add(path)
+            path = os.path.dirname(path)
     
     def _write_file(self, path: Path, content: str):
         """Write content to file"""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
-            f.write(content.strip())
+        self._mkdir(path.parent)
+        path.write_text(content.strip(), encoding='utf-8')
     
     def _write_json(self, path: Path, data: Dict):
-        """Write JSON to file"""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Write JSON to file, using orjson when it is installed"""
+        self._mkdir(path.parent)
+        path.write_bytes(_dump_json(data))
     
     def run(self):
         """Execute the complete setup"""
         print(f"\n🚀 Setting up {self.project_name}...\n")
         
+        # The tree may have been removed since the last run
+        self._mkdir_cache.clear()
+        
         try:
             self.create_directory_structure()
-            self.create_root_config_files()
-            self.create_backend_app()
-            self.create_docker_setup()
-            self.create_github_actions()
+            
+            # These steps write to disjoint subtrees, so they can overlap.
+            # Banners are printed here, in order, as each step finishes.
+            steps = [
+                (self.create_root_config_files,
+                 "⚙️  Creating configuration files...", "✅ Configuration files created"),
+                (self.create_backend_app,
+                 "🔧 Setting up NestJS backend...", "✅ Backend app created"),
+                (self.create_docker_setup,
+                 "🐳 Creating Docker setup...", "✅ Docker setup created"),
+                (self.create_github_actions,
+                 "🔄 Creating GitHub Actions workflow...", "✅ GitHub Actions workflow created"),
+            ]
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                futures = [(pool.submit(step), start, done) for step, start, done in steps]
+                for future, start, done in futures:
+                    print(start)
+                    future.result()
+                    print(done)
             
             print(f"\n✨ Project {self.project_name} created successfully!")
             print(f"\n📍 Location: {self.base_path.absolute()}")
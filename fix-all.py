@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Single-pass driver for fix-repositories.py and fix-usecases-phase2.py
+Walks both target trees once and fixes every file in one process pool
+"""
+
+import importlib.util
+import multiprocessing
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+def load_script(module_name: str, filename: str):
+    """Import one of the hyphenated fix scripts as a module"""
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    # Register it so pool workers can unpickle its functions
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+repositories = load_script("fix_repositories", "fix-repositories.py")
+phase2 = load_script("fix_usecases_phase2", "fix-usecases-phase2.py")
+
+def find_files():
+    """Collect (fixer, file) jobs from both trees"""
+    jobs = []
+
+    if repositories.REPO_DIR.exists():
+        for file_path in repositories.REPO_DIR.glob("prisma-*.repository.ts"):
+            jobs.append((repositories.fix_repository_file, file_path))
+    else:
+        print(f"ERROR: Directory not found: {repositories.REPO_DIR}")
+
+    if phase2.BASE_DIR.exists():
+        for file_path in phase2.walk_use_cases(str(phase2.BASE_DIR)):
+            jobs.append((phase2.process_file, file_path))
+    else:
+        print(f"ERROR: Directory not found: {phase2.BASE_DIR}")
+
+    # Stable log order from run to run
+    jobs.sort(key=lambda job: str(job[1]))
+    return jobs
+
+def fix_file(job) -> Tuple[bool, List[str]]:
+    """Run the fixer that owns this file"""
+    fixer, file_path = job
+    return fixer(file_path)
+
+def main():
+    jobs = find_files()
+
+    print(f"\nFound {len(jobs)} files\n")
+
+    # Each file belongs to exactly one script, so it is read and written once
+    fixed_count = 0
+    log = []
+    with multiprocessing.Pool() as pool:
+        for changed, messages in pool.imap(fix_file, jobs, chunksize=4):
+            fixed_count += changed
+            log.extend(messages)
+
+    sys.stdout.write("".join(f"{line}\n" for line in log))
+
+    print(f"\n✓ Fixed {fixed_count}/{len(jobs)} files")
+
+if __name__ == "__main__":
+    main()
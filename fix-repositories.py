@@ -4,84 +4,128 @@ Quick fix script for repository Result unwrapping
 Corrects mapper.toDomain() calls to handle Result<Entity> properly
 """
 
+import mmap
+import multiprocessing
+import os
 import re
+import sys
 from pathlib import Path
-
-def fix_repository_file(file_path: Path):
-    """Fix a single repository file"""
-    print(f"Processing {file_path.name}...")
-
-    with open(file_path, 'r') as f:
-        content = f.read()
-
-    original = content
-
-    # Fix: Remove datetime.vo import
-    content = re.sub(
-        r"import \{ DateTime \} from '@barbershop/domain/value-objects/datetime\.vo'",
-        "import { DateTime } from 'luxon'",
-        content
-    )
-
-    # Fix: Remove specialty.vo import
-    content = re.sub(
-        r"import \{ Specialty \} from '@barbershop/domain/value-objects/specialty\.vo'",
-        "",
-        content
-    )
+from typing import List, Tuple
+
+REPO_DIR = Path("/Users/federiconicolascarrizo/Documents/Repositorios/barberia/packages/infrastructure/src/repositories")
+
+IMPORT_REPLACEMENTS = {
+    'DateTime': "import { DateTime } from 'luxon'",
+    'Specialty': "",
+}
+
+# (pattern, replacement) pairs, compiled once and applied in order
+PATTERNS = [
+    # Fix: Replace datetime.vo import with luxon, remove specialty.vo import
+    (
+        # Each name only matches with its own file; lastindex says which one did
+        re.compile(
+            r"import \{ (DateTime) \} from '@barbershop/domain/value-objects/datetime\.vo'"
+            r"|import \{ (Specialty) \} from '@barbershop/domain/value-objects/specialty\.vo'"
+        ),
+        lambda m: IMPORT_REPLACEMENTS[m.group(m.lastindex)],
+    ),
 
     # Fix: Unwrap Result from mapper.toDomain()
     # Pattern: const entity = Mapper.toDomain(raw)
     # Replace with: const entityResult = Mapper.toDomain(raw); unwrap
 
     # For assignments that expect Entity | null
-    content = re.sub(
-        r'(\s+)(const \w+ = )(\w+Mapper\.toDomain\([^)]+\))',
+    (
+        re.compile(r'(\s+)(const \w+ = )(\w+Mapper\.toDomain\([^)]+\))'),
         r'\1\2\3\n\1if (\2.isFailure) return null',
-        content
-    )
+    ),
 
     # Fix version property access (entities don't have .version)
-    content = re.sub(
-        r'(\w+)\.version',
-        r'0 // version managed by repository',
-        content
-    )
+    # Only entity instances; other .version reads (package.json etc.) are left alone
+    (
+        re.compile(r'\b(appointment|barber|client|service|payment|rating)\.version\b'),
+        '0 /* version managed by repository */',
+    ),
 
     # Fix Result unwrapping in return statements
-    content = re.sub(
-        r'return (\w+Mapper\.toDomain\([^)]+\))',
+    (
+        re.compile(r'return (\w+Mapper\.toDomain\([^)]+\))'),
         r'const result = \1\n    return result.isSuccess ? result.value : null',
-        content
-    )
+    ),
 
     # Fix .toDate() → .toJSDate()
-    content = re.sub(r'\.toDate\(\)', '.toJSDate()', content)
+    (re.compile(r'\.toDate\(\)'), '.toJSDate()'),
+]
+
+# Literal text every pattern above needs, so the byte check never skips a
+# file the patterns would change (\w and \s are ASCII-only on bytes)
+FIX_TOKENS = (
+    "Mapper.toDomain(",
+    ".version",
+    ".toDate()",
+    "value-objects/datetime.vo",
+    "value-objects/specialty.vo",
+)
+
+TRIGGER_RE = re.compile("|".join(map(re.escape, FIX_TOKENS)).encode())
+
+def needs_fix(file_path: Path) -> bool:
+    """Check the mapped file for any fix token before decoding it"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return TRIGGER_RE.search(mm) is not None
+
+def fix_content(content: str) -> str:
+    """Apply every pattern in order"""
+    for pattern, replacement in PATTERNS:
+        content = pattern.sub(replacement, content)
+    return content
+
+def fix_repository_file(file_path: Path) -> Tuple[bool, List[str]]:
+    """Fix a single repository file, returning (changed, log lines)"""
+    log = [f"Processing {file_path.name}..."]
+
+    if not needs_fix(file_path):
+        log.append(f"- No changes needed for {file_path.name}")
+        return False, log
+
+    with open(file_path, 'r') as f:
+        content = f.read()
+
+    original = content
+    content = fix_content(content)
 
     if content != original:
         with open(file_path, 'w') as f:
             f.write(content)
-        print(f"✓ Fixed {file_path.name}")
-        return True
+        log.append(f"✓ Fixed {file_path.name}")
+        return True, log
     else:
-        print(f"- No changes needed for {file_path.name}")
-        return False
+        log.append(f"- No changes needed for {file_path.name}")
+        return False, log
 
 def main():
-    repo_dir = Path("/Users/federiconicolascarrizo/Documents/Repositorios/barberia/packages/infrastructure/src/repositories")
-
-    if not repo_dir.exists():
-        print(f"ERROR: Directory not found: {repo_dir}")
+    if not REPO_DIR.exists():
+        print(f"ERROR: Directory not found: {REPO_DIR}")
         return
 
-    files = list(repo_dir.glob("prisma-*.repository.ts"))
+    files = sorted(REPO_DIR.glob("prisma-*.repository.ts"))
 
     print(f"\nFound {len(files)} repository files\n")
 
+    # Files are independent, so fix them across all cores
     fixed_count = 0
-    for file_path in files:
-        if fix_repository_file(file_path):
-            fixed_count += 1
+    log = []
+    with multiprocessing.Pool() as pool:
+        for changed, messages in pool.imap(fix_repository_file, files, chunksize=4):
+            fixed_count += changed
+            log.extend(messages)
+
+    # One write for the whole run instead of a print per file
+    sys.stdout.write("".join(f"{line}\n" for line in log))
 
     print(f"\n✓ Fixed {fixed_count}/{len(files)} files")
 
@@ -3,94 +3,124 @@
 Fase 2: Correcciones específicas restantes
 """
 
+import mmap
+import multiprocessing
+import os
 import re
+import sys
 from pathlib import Path
+from typing import List, Tuple
 
 BASE_DIR = Path("/Users/federiconicolascarrizo/Documents/Repositorios/barberia/packages/application/src/use-cases")
 
+# Literales que aparecen en todo lo que corrigen las funciones fix_*
+FIX_TOKENS = (
+    r"DateTime\.fromJSDate",
+    r"barber\.specialties",
+    r"isAvailableAt",
+    r"PaymentInfo",
+    r"recordCompletedAppointment",
+    r"\.cancel\(dto\.reason\)",
+    r"addNotes",
+)
+# Sobre bytes, para revisar el archivo antes de decodificarlo
+TRIGGER_RE = re.compile("|".join(FIX_TOKENS).encode())
+
+# Patrones de las funciones fix_*, compilados una sola vez al importar.
+# \s ya cubre los saltos de línea, así que ninguno necesita re.DOTALL.
+
+# DateTime.fromJSDate con validación de Result, o un acceso suelto a .value
+DATETIME_RE = re.compile(
+    r"const (?P<var>\w+)OrError = DateTime\.fromJSDate\((?P<expr>[^)]+)\)\s*if \((?P=var)OrError\.isFailure\) \{[^}]+\}\s*const (?P=var) = (?P=var)OrError\.value"
+    r"|(?P<call>DateTime\.fromJSDate\([^)]+\))\.value"
+)
+
+SPECIALTIES_SOME_RE = re.compile(r"barber\.specialties\.some\(specialty => specialty\.value === (\w+)\)")
+
+IS_AVAILABLE_AT_RE = re.compile(r"barber\.isAvailableAt\((\w+)\)")
+
+# PaymentInfo.create({ method, amount, status }) → PaymentInfo.pending(amount)
+PAYMENT_INFO_CREATE_RE = re.compile(r"PaymentInfo\.create\(\{[^}]+\}\)")
+PAYMENT_INFO_IMPORT_RE = re.compile(r"(import \{ PaymentInfo \})")
+
+BARBER_METRICS_RE = re.compile(r"\s*// \d+\. Update barber metrics\s*barber\.recordCompletedAppointment\(\)\s*")
+CLIENT_METRICS_RE = re.compile(r"client\.recordCompletedAppointment\(\)")
+
+CANCEL_REASON_RE = re.compile(r"\.cancel\(dto\.reason\)")
+COMPLETE_NOTES_RE = re.compile(r"\.complete\(dto\.notes\)")
+
+ADD_NOTES_RE = re.compile(
+    r"\s*// Add optional reason as notes if provided\s*if \(dto\.reason\) \{\s*appointment\.addNotes\(`No-show reason: \$\{dto\.reason\}`\)\s*\}"
+)
+
+def needs_fix(filepath: Path) -> bool:
+    """Busca los disparadores en el archivo mapeado, sin decodificarlo"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return TRIGGER_RE.search(mm) is not None
+
+def walk_use_cases(root: str):
+    """Recorre el árbol con os.scandir y devuelve los *.use-case.ts"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.use-case.ts'):
+                    yield Path(entry.path)
+
 def fix_datetime_validation(content: str) -> str:
     """DateTime de luxon no tiene .isFailure, crear Date directamente"""
-    # Pattern para DateTime.fromJSDate con validación de Result
-    pattern = r"const (\w+)OrError = DateTime\.fromJSDate\(([^)]+)\)\s*if \(\1OrError\.isFailure\) \{([^}]+)\}\s*const \1 = \1OrError\.value"
-
     def replacement(match):
-        var_name = match.group(1)
-        date_expr = match.group(2)
-        return f"const {var_name} = DateTime.fromJSDate({date_expr})"
-
-    content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+        # También arreglar accesos a .value de DateTime
+        if match.group('call'):
+            return match.group('call')
+        return f"const {match.group('var')} = DateTime.fromJSDate({match.group('expr')})"
 
-    # También arreglar accesos a .value de DateTime
-    content = re.sub(r"DateTime\.fromJSDate\([^)]+\)\.value", lambda m: m.group(0).replace('.value', ''), content)
-
-    return content
+    return DATETIME_RE.sub(replacement, content)
 
 def fix_barber_specialties(content: str) -> str:
     """BarberSpecialties.specialties es array de Specialty"""
     # barber.specialties.some(specialty => specialty.value === skill)
     #  → barber.specialties.specialties.some(s => s === skill)
-    content = re.sub(
-        r"barber\.specialties\.some\(specialty => specialty\.value === (\w+)\)",
-        r"barber.specialties.specialties.includes(\1)",
-        content
-    )
-
-    # Similar para service.requiredSkills.every
-    content = re.sub(
-        r"service\.requiredSkills\.every\(skill =>\s*barber\.specialties\.specialties\.includes\(skill\)\)",
-        lambda m: m.group(0),  # Ya está correcto
-        content
-    )
-
-    return content
+    # service.requiredSkills.every(...) ya está correcto, no hace falta tocarlo
+    return SPECIALTIES_SOME_RE.sub(r"barber.specialties.specialties.includes(\1)", content)
 
 def fix_barber_is_available_at(content: str) -> str:
     """barber.isAvailableAt(slot) → verificación manual o isAvailable()"""
     # Por ahora simplemente usar isAvailable() que no recibe parámetros
-    content = re.sub(
-        r"barber\.isAvailableAt\((\w+)\)",
-        "barber.isAvailable()",
-        content
-    )
-    return content
+    return IS_AVAILABLE_AT_RE.sub("barber.isAvailable()", content)
 
 def fix_payment_info_create(content: str) -> str:
     """PaymentInfo.create(...) → PaymentInfo.pending(...)"""
-    # PaymentInfo.create({ method, amount, status }) → PaymentInfo.pending(amount)
-    pattern = r"PaymentInfo\.create\(\{[^}]+\}\)"
-
     def replacement(match):
         # Extraer el amount de service.price
         return "PaymentInfo.pending(service.price)"
 
-    content = re.sub(pattern, replacement, content)
+    content = PAYMENT_INFO_CREATE_RE.sub(replacement, content)
 
     # También necesitamos agregar el import de PaymentMethod si se usa
     if "PaymentInfo" in content and "PaymentMethod" not in content:
         # Agregar al import existente
-        content = re.sub(
-            r"(import \{ PaymentInfo \})",
-            r"import { PaymentInfo, PaymentMethod }",
-            content
-        )
+        content = PAYMENT_INFO_IMPORT_RE.sub(r"import { PaymentInfo, PaymentMethod }", content)
 
     return content
 
 def fix_barber_client_metrics(content: str) -> str:
     """Corregir métodos de métricas"""
     # barber.recordCompletedAppointment() no existe, eliminar esa línea
-    content = re.sub(
-        r"\s*// \d+\. Update barber metrics\s*barber\.recordCompletedAppointment\(\)\s*",
+    content = BARBER_METRICS_RE.sub(
         "\n    // Note: Barber metrics are updated through domain events\n",
-        content,
-        flags=re.DOTALL
+        content
     )
 
     # client.recordCompletedAppointment() → client.recordAppointmentCompleted(service.price, now)
     # Pero necesitamos el service y la fecha, esto es complejo
     # Por ahora comentar
-    content = re.sub(
-        r"client\.recordCompletedAppointment\(\)",
+    content = CLIENT_METRICS_RE.sub(
         "// TODO: client.recordAppointmentCompleted(service.price, new Date())",
         content
     )
@@ -101,15 +131,10 @@ def fix_optional_string_args(content: str) -> str:
     """Corregir argumentos string | undefined"""
     # cancel(dto.reason) donde reason puede ser undefined
     # Cambiar a cancel(dto.reason || '')
-    content = re.sub(
-        r"\.cancel\(dto\.reason\)",
-        ".cancel(dto.reason || 'No reason provided')",
-        content
-    )
+    content = CANCEL_REASON_RE.sub(".cancel(dto.reason || 'No reason provided')", content)
 
     # complete(dto.notes) donde notes puede ser undefined
-    content = re.sub(
-        r"\.complete\(dto\.notes\)",
+    content = COMPLETE_NOTES_RE.sub(
         ".complete(dto.notes)",  # complete ya acepta undefined
         content
     )
@@ -122,15 +147,11 @@ def fix_optional_string_args(content: str) -> str:
 def fix_appointment_add_notes(content: str) -> str:
     """appointment.addNotes() no existe, las notas se pasan en complete()"""
     # Eliminar líneas de addNotes
-    content = re.sub(
-        r"\s*// Add optional reason as notes if provided\s*if \(dto\.reason\) \{\s*appointment\.addNotes\(`No-show reason: \$\{dto\.reason\}`\)\s*\}",
+    return ADD_NOTES_RE.sub(
         "\n    // Note: Reason handling would need to be added to Appointment entity",
-        content,
-        flags=re.DOTALL
+        content
     )
 
-    return content
-
 def fix_barber_schedule_iteration(content: str) -> str:
     """barber.schedule.filter() - BarberSchedule es VO no array"""
     # La iteración sobre schedule es compleja, necesita acceder a workingHours
@@ -138,51 +159,68 @@ def fix_barber_schedule_iteration(content: str) -> str:
 
     return content
 
-def process_file(filepath: Path) -> bool:
-    """Procesa un archivo aplicando correcciones fase 2"""
-    print(f"Procesando: {filepath.name}")
+def fix_content(content: str) -> str:
+    """Aplica todas las correcciones fase 2 al contenido"""
+    content = fix_datetime_validation(content)
+    content = fix_barber_specialties(content)
+    content = fix_barber_is_available_at(content)
+    content = fix_payment_info_create(content)
+    content = fix_barber_client_metrics(content)
+    content = fix_optional_string_args(content)
+    content = fix_appointment_add_notes(content)
+    content = fix_barber_schedule_iteration(content)
+    return content
+
+def process_file(filepath: Path) -> Tuple[bool, List[str]]:
+    """Procesa un archivo aplicando correcciones fase 2; devuelve (cambió, log)"""
+    log = [f"Procesando: {filepath.name}"]
 
     try:
+        if not needs_fix(filepath):
+            log.append(f"  ⏭️  Sin cambios")
+            return False, log
+
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
         original = content
-
-        # Aplicar correcciones fase 2
-        content = fix_datetime_validation(content)
-        content = fix_barber_specialties(content)
-        content = fix_barber_is_available_at(content)
-        content = fix_payment_info_create(content)
-        content = fix_barber_client_metrics(content)
-        content = fix_optional_string_args(content)
-        content = fix_appointment_add_notes(content)
-        content = fix_barber_schedule_iteration(content)
+        content = fix_content(content)
 
         if content != original:
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(content)
-            print(f"  ✅ Corregido")
-            return True
+            log.append(f"  ✅ Corregido")
+            return True, log
         else:
-            print(f"  ⏭️  Sin cambios")
-            return False
+            log.append(f"  ⏭️  Sin cambios")
+            return False, log
 
     except Exception as e:
-        print(f"  ❌ Error: {e}")
-        return False
+        log.append(f"  ❌ Error: {e}")
+        return False, log
 
 def main():
     print("🔧 Fase 2: Correcciones específicas")
     print("="*60)
 
-    files = list(BASE_DIR.glob("**/*.use-case.ts"))
+    if not BASE_DIR.exists():
+        print(f"ERROR: No se encontró el directorio: {BASE_DIR}")
+        return
+
+    files = list(walk_use_cases(str(BASE_DIR)))
     print(f"\nArchivos encontrados: {len(files)}")
     print("-"*60)
 
+    # Cada archivo es independiente: repartirlos entre todos los núcleos
     corrected = 0
-    for filepath in sorted(files):
-        if process_file(filepath):
-            corrected += 1
+    log = []
+    with multiprocessing.Pool() as pool:
+        for changed, messages in pool.imap(process_file, sorted(files), chunksize=4):
+            corrected += changed
+            log.extend(messages)
+
+    # Una sola escritura al final en vez de un print por archivo
+    sys.stdout.write("".join(f"{line}\n" for line in log))
 
     print("-"*60)
     print(f"\n✨ Fase 2 completada!")
@@ -4,159 +4,198 @@ Script para corregir automáticamente los errores de compilación TypeScript
 en los use cases de la capa de aplicación.
 """
 
+import argparse
+import mmap
+import multiprocessing
 import re
 import os
+import sys
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Directorio base
 BASE_DIR = Path("/Users/federiconicolascarrizo/Documents/Repositorios/barberia/packages/application/src/use-cases")
 
-def fix_datetime_imports(content: str) -> str:
-    """Corrige los imports de DateTime"""
-    # Reemplazar import incorrecto con luxon
-    content = re.sub(
-        r"import \{ DateTime \} from '@barbershop/domain/value-objects/datetime\.vo'",
-        "import { DateTime } from 'luxon'",
-        content
-    )
-    return content
-
-def fix_id_vo_usage(content: str) -> str:
-    """Corrige el uso de Value Objects IDs (no son Result)"""
-    # AppointmentId
-    content = re.sub(
-        r"const appointmentIdOrError = AppointmentId\.create\(([^)]+)\)\s*if \(appointmentIdOrError\.isFailure\) \{\s*return Result\.fail<Appointment>\(`Invalid appointment ID: \$\{appointmentIdOrError\.error\}`\)\s*\}\s*const appointmentId = appointmentIdOrError\.getValue\(\)",
-        r"const appointmentId = AppointmentId.create(\1)",
-        content,
-        flags=re.DOTALL
-    )
-
-    # BarberId
-    content = re.sub(
-        r"const barberIdOrError = BarberId\.create\(([^)]+)\)\s*if \(barberIdOrError\.isFailure\) \{\s*return Result\.fail<[^>]+>\(`Invalid barber ID: \$\{barberIdOrError\.error\}`\)\s*\}\s*const barberId = barberIdOrError\.getValue\(\)",
-        r"const barberId = BarberId.create(\1)",
-        content,
-        flags=re.DOTALL
-    )
-
-    # ClientId
-    content = re.sub(
-        r"const clientIdOrError = ClientId\.create\(([^)]+)\)\s*if \(clientIdOrError\.isFailure\) \{\s*return Result\.fail<[^>]+>\(`Invalid client ID: \$\{clientIdOrError\.error\}`\)\s*\}\s*const clientId = clientIdOrError\.getValue\(\)",
-        r"const clientId = ClientId.create(\1)",
-        content,
-        flags=re.DOTALL
-    )
-
-    # ServiceId
-    content = re.sub(
-        r"const serviceIdOrError = ServiceId\.create\(([^)]+)\)\s*if \(serviceIdOrError\.isFailure\) \{\s*return Result\.fail<[^>]+>\(`Invalid service ID: \$\{serviceIdOrError\.error\}`\)\s*\}\s*const serviceId = serviceIdOrError\.getValue\(\)",
-        r"const serviceId = ServiceId.create(\1)",
-        content,
-        flags=re.DOTALL
-    )
-
-    return content
-
-def fix_entity_apis(content: str) -> str:
-    """Corrige el uso de las APIs de entidades"""
-    # Barber.isActive → barber.status.isActive()
-    content = re.sub(r"barber\.isActive", "barber.status.isActive()", content)
+# Texto que necesita cada corrección; lo comparten PROBES y los chequeos de process_file
+DATETIME_IMPORT_TOKEN = "value-objects/datetime.vo"
+ID_VO_TOKEN = "IdOrError"
+DATETIME_CREATE_TOKEN = "DateTime.create("
+TIMESLOT_TOKEN = "TimeSlot.create({"
 
-    # Client.isActive → client.status.isActive()
-    content = re.sub(r"client\.isActive", "client.status.isActive()", content)
+# Patrones de las funciones fix_*, compilados una sola vez al importar
+DATETIME_IMPORT_RE = re.compile(r"import \{ DateTime \} from '@barbershop/domain/value-objects/datetime\.vo'")
 
+# const xIdOrError = XId.create(...) + chequeo isFailure, para los cuatro IDs.
+# Los argumentos no cruzan líneas: si falta el cierre, el intento falla en esa
+# línea en vez de recorrer el resto del archivo.
+ID_VO_RE = re.compile(
+    r"const (appointment|barber|client|service)IdOrError = (Appointment|Barber|Client|Service)Id\.create\(([^)\n]+)\)\s*if \(\1IdOrError\.isFailure\) \{\s*return Result\.fail<[^>\n]+>\(`Invalid \1 ID: \$\{\1IdOrError\.error\}`\)\s*\}\s*const \1Id = \1IdOrError\.getValue\(\)"
+)
+
+# Reemplazos literal → literal, aplicados todos en una sola pasada
+LITERAL_MAP = {
+    # Barber.isActive → barber.status.isActive()
+    "barber.isActive": "barber.status.isActive()",
+    # Client.isActive → client.status.isActive()
+    "client.isActive": "client.status.isActive()",
     # appointment.status.value → appointment.status (enum directo)
-    content = re.sub(r"appointment\.status\.value", "appointment.status", content)
-    content = re.sub(r"apt\.status\.value", "apt.status", content)
+    "appointment.status.value": "appointment.status",
+    "apt.status.value": "apt.status",
+    # .toDate() → .toJSDate() de luxon
+    ".toDate()": ".toJSDate()",
+    # Result: .getValue() → .value
+    ".getValue()": ".value",
+}
+# El más largo primero, para que ninguno gane dentro de otro
+LITERALS_RE = re.compile("|".join(re.escape(k) for k in sorted(LITERAL_MAP, key=len, reverse=True)))
+
+DATETIME_CREATE_RE = re.compile(r"DateTime\.create\(([^)]+)\)")
+
+# TimeSlot.create({ startTime, endTime }) y la forma con claves explícitas
+TIMESLOT_RE = re.compile(
+    r"TimeSlot\.create\(\{\s*startTime(?:\s*:\s*([^,]+))?\s*,\s*endTime(?:\s*:\s*([^}]+))?\s*\}\)"
+)
+
+# Cada fix_* devuelve (contenido, cantidad de reemplazos)
+
+def fix_datetime_imports(content: str) -> Tuple[str, int]:
+    """Corrige los imports de DateTime"""
+    # Reemplazar import incorrecto con luxon
+    return DATETIME_IMPORT_RE.subn("import { DateTime } from 'luxon'", content)
 
+def fix_id_vo_usage(content: str) -> Tuple[str, int]:
+    """Corrige el uso de Value Objects IDs (no son Result)"""
+    # subn también contaría los bloques que se dejan igual, así que se cuenta acá
+    replaced = 0
+
+    def replacement(match):
+        nonlocal replaced
+        var_name, vo_name, arg = match.groups()
+        # La variable y el VO tienen que ser del mismo ID (barberId ↔ BarberId)
+        if vo_name.lower() != var_name:
+            return match.group(0)
+        replaced += 1
+        return f"const {var_name}Id = {vo_name}Id.create({arg})"
+
+    return ID_VO_RE.sub(replacement, content), replaced
+
+def fix_literals(content: str) -> Tuple[str, int]:
+    """Corrige el uso de las APIs de entidades, .toDate() y .getValue()"""
     # Barber.firstName/lastName → barber.name.fullName o barber.getDisplayName()
     # Este es más complejo, por ahora solo agrego el método correcto
+    return LITERALS_RE.subn(lambda m: LITERAL_MAP[m.group(0)], content)
 
-    return content
-
-def fix_datetime_methods(content: str) -> str:
+def fix_datetime_methods(content: str) -> Tuple[str, int]:
     """Corrige métodos de DateTime de luxon"""
-    # .toDate() → .toJSDate()
-    content = re.sub(r"\.toDate\(\)", ".toJSDate()", content)
-
     # DateTime.create() → DateTime.fromJSDate()
-    content = re.sub(
-        r"DateTime\.create\(([^)]+)\)",
-        r"DateTime.fromJSDate(\1)",
-        content
-    )
-
     # DateTime.now() está correcto en luxon
+    return DATETIME_CREATE_RE.subn(r"DateTime.fromJSDate(\1)", content)
 
-    return content
-
-def fix_timeslot_create(content: str) -> str:
+def fix_timeslot_create(content: str) -> Tuple[str, int]:
     """Corrige llamadas a TimeSlot.create()"""
     # TimeSlot.create({ startTime, endTime }) → TimeSlot.create(startTime, endTime)
-    content = re.sub(
-        r"TimeSlot\.create\(\{\s*startTime,\s*endTime\s*\}\)",
-        "TimeSlot.create(startTime, endTime)",
-        content
-    )
-    content = re.sub(
-        r"TimeSlot\.create\(\{\s*startTime:\s*([^,]+),\s*endTime:\s*([^}]+)\s*\}\)",
-        r"TimeSlot.create(\1, \2)",
-        content
-    )
-
-    return content
-
-def fix_result_getvalue(content: str) -> str:
-    """Corrige .getValue() → .value"""
-    content = re.sub(r"\.getValue\(\)", ".value", content)
-    return content
-
-def process_file(filepath: Path) -> bool:
-    """Procesa un archivo aplicando todas las correcciones"""
-    print(f"Procesando: {filepath.name}")
-
+    def replacement(match):
+        start = (match.group(1) or "startTime").strip()
+        end = (match.group(2) or "endTime").strip()
+        return f"TimeSlot.create({start}, {end})"
+
+    return TIMESLOT_RE.subn(replacement, content)
+
+# Tokens que necesita alguna corrección, buscados sobre los bytes sin decodificar
+PROBES = tuple(token.encode() for token in (
+    DATETIME_IMPORT_TOKEN,
+    ID_VO_TOKEN,
+    DATETIME_CREATE_TOKEN,
+    TIMESLOT_TOKEN,
+    *LITERAL_MAP,
+))
+
+def read_if_needed(filepath: Path) -> Optional[bytes]:
+    """Devuelve los bytes del archivo, o None si no tiene nada que corregir"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not any(mm.find(probe) != -1 for probe in PROBES):
+                return None
+            return mm[:]
+
+def process_file(filepath: Path) -> Tuple[str, str, Optional[str]]:
+    """Procesa un archivo aplicando todas las correcciones.
+
+    Devuelve (nombre, estado, error) con estado "changed", "skipped" o "error".
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original = content
-
-        # Aplicar correcciones
-        content = fix_datetime_imports(content)
-        content = fix_id_vo_usage(content)
-        content = fix_entity_apis(content)
-        content = fix_datetime_methods(content)
-        content = fix_timeslot_create(content)
-        content = fix_result_getvalue(content)
-
-        # Solo escribir si hubo cambios
-        if content != original:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"  ✅ Corregido: {filepath.name}")
-            return True
+        # Una sola lectura de bytes; se decodifica solo si hay algo que corregir
+        raw = read_if_needed(filepath)
+        if raw is None:
+            return filepath.name, "skipped", None
+        content = raw.decode('utf-8')
+
+        # Aplicar correcciones, saltando las que no tienen nada que corregir
+        total = 0
+        if DATETIME_IMPORT_TOKEN in content:
+            content, count = fix_datetime_imports(content)
+            total += count
+        if ID_VO_TOKEN in content:
+            content, count = fix_id_vo_usage(content)
+            total += count
+        if any(token in content for token in LITERAL_MAP):
+            content, count = fix_literals(content)
+            total += count
+        if DATETIME_CREATE_TOKEN in content:
+            content, count = fix_datetime_methods(content)
+            total += count
+        if TIMESLOT_TOKEN in content:
+            content, count = fix_timeslot_create(content)
+            total += count
+
+        # Solo escribir si hubo reemplazos; todos cambian el texto
+        if total > 0:
+            filepath.write_bytes(content.encode('utf-8'))
+            return filepath.name, "changed", None
         else:
-            print(f"  ⏭️  Sin cambios: {filepath.name}")
-            return False
+            return filepath.name, "skipped", None
 
     except Exception as e:
-        print(f"  ❌ Error: {e}")
-        return False
+        return filepath.name, "error", str(e)
+
+def format_result(name: str, status: str, error: Optional[str]) -> str:
+    """Línea de resumen para un archivo procesado"""
+    if status == "changed":
+        return f"  ✅ Corregido: {name}"
+    if status == "error":
+        return f"  ❌ Error en {name}: {error}"
+    return f"  ⏭️  Sin cambios: {name}"
 
 def main():
+    parser = argparse.ArgumentParser(description="Corrige los use cases de la capa de aplicación")
+    parser.add_argument("-v", "--verbose", action="store_true", help="listar también los archivos sin cambios")
+    args = parser.parse_args()
+
     print("🔧 Iniciando corrección de use cases...")
     print("="*60)
 
-    # Buscar todos los archivos .ts en use-cases
-    files = list(BASE_DIR.glob("**/*.use-case.ts"))
+    # Buscar todos los archivos .ts en use-cases, ya ordenados por ruta
+    files = sorted(BASE_DIR.rglob("*.use-case.ts"), key=os.fspath)
 
     print(f"\nArchivos encontrados: {len(files)}")
     print("-"*60)
 
-    corrected = 0
-    for filepath in sorted(files):
-        if process_file(filepath):
-            corrected += 1
+    # Cada archivo es independiente: repartirlos entre todos los núcleos
+    with multiprocessing.Pool() as pool:
+        results = list(pool.imap(process_file, files, chunksize=4))
+
+    corrected = sum(status == "changed" for _, status, _ in results)
+
+    # Un solo write con el resumen, en lugar de dos prints por archivo
+    lines = [
+        format_result(*result)
+        for result in results
+        if args.verbose or result[1] != "skipped"
+    ]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("-"*60)
     print(f"\n✨ Proceso completado!")